@@ -6,7 +6,7 @@ import time
 from typing import Any
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from tools.verify_test import router as verify_router, verify_test as verify_test_tool
 from tools.text_normalize import router as text_normalize_router
 from tools.schema_validate import router as schema_validate_router
@@ -26,7 +26,7 @@ from tools.capability_contract import capability_contract as capability_contract
 from tools.rule_trace import rule_trace as rule_trace_tool
 from tools.schema_diff import schema_diff as schema_diff_tool
 from tools.enum_registry import enum_registry as enum_registry_tool
-from tools._shared.contracts import CONTRACTS, contract_summaries
+from tools._shared.contracts import CONTRACT_BYTES, CONTRACTS, contract_summaries
 from tools._shared.errors import make_error
 
 
@@ -374,12 +374,12 @@ def list_contracts():
 
 
 def _get_contract_or_error(name: str):
-    contract = CONTRACTS.get(name)
-    if not contract:
+    contract_bytes = CONTRACT_BYTES.get(name)
+    if not contract_bytes:
         response = make_error("CONTRACT_NOT_FOUND", "Contract not found.")
         response.status_code = 404
         return response
-    return contract
+    return Response(content=contract_bytes, media_type="application/json")
 
 
 @app.get("/contracts/{name}")
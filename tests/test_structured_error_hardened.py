@@ -184,3 +184,195 @@ def test_structured_error_missing_required_fields():
             "fingerprint": "5ec20af2b445b247",
         },
     }
+
+
+def test_structured_error_repeat_same_input():
+    payload = {
+        "source": {"tool": "svc", "stage": "call", "version": "1.0"},
+        "error": {"code": "UPSTREAM_DOWN", "message": "bad gateway", "http_status": 502},
+        "policy": {"max_message_length": 300, "include_raw_message": True},
+    }
+    status_first, body_first = request_json(app, "POST", "/tools/structured_error", payload)
+    status_second, body_second = request_json(app, "POST", "/tools/structured_error", payload)
+    assert status_first == 200
+    assert status_second == 200
+    assert body_first == body_second
+    assert body_first["result"]["error"]["class"] == "UPSTREAM"
+
+
+def test_structured_error_repeat_invalid_input():
+    payload = {"source": {"tool": "svc", "stage": "run"}, "error": 7, "policy": {}}
+    status_first, body_first = request_json(app, "POST", "/tools/structured_error", payload)
+    status_second, body_second = request_json(app, "POST", "/tools/structured_error", payload)
+    assert status_first == 400
+    assert status_second == 400
+    assert body_first == body_second
+    assert body_first["error"]["code"] == "ERROR_INVALID"
+
+
+def test_structured_error_lone_surrogate_message():
+    status, body = request_json(
+        app,
+        "POST",
+        "/tools/structured_error",
+        {
+            "source": {"tool": "svc", "stage": "run", "version": "1.0"},
+            "error": {"code": "UPSTREAM_DOWN", "message": "ok \ud800"},
+            "policy": {"max_message_length": 300, "include_raw_message": False},
+        },
+    )
+    assert status == 200
+    assert body["result"]["error"]["class"] == "UPSTREAM"
+    assert body["result"]["error"]["message"] == ""
+
+
+def test_structured_error_nested_error_object():
+    status, body = request_json(
+        app,
+        "POST",
+        "/tools/structured_error",
+        {
+            "source": {"tool": "svc", "stage": "call", "version": "1.0"},
+            "error": {"error": {"code": "RATE_LIMITED", "message": "slow down", "http_status": 429}},
+            "policy": {"max_message_length": 300, "include_raw_message": True},
+        },
+    )
+    assert status == 200
+    error = body["result"]["error"]
+    assert error["class"] == "RATE_LIMIT"
+    assert error["code"] == "RATE_LIMITED"
+    assert error["http_status"] == 429
+    assert error["retryable"] is True
+
+
+def test_structured_error_nested_error_ignores_aliases():
+    for nested in ({"detail": "not found"}, {"status": 503}):
+        status, body = request_json(
+            app,
+            "POST",
+            "/tools/structured_error",
+            {
+                "source": {"tool": "svc", "stage": "call", "version": "1.0"},
+                "error": {"error": nested},
+                "policy": {"max_message_length": 300, "include_raw_message": True},
+            },
+        )
+        assert status == 200
+        error = body["result"]["error"]
+        assert error["class"] == "UNKNOWN"
+        assert error["message"] == ""
+        assert error["http_status"] == 0
+
+
+def test_structured_error_coerces_error_field_types():
+    status, body = request_json(
+        app,
+        "POST",
+        "/tools/structured_error",
+        {
+            "source": {"tool": "svc", "stage": "run", "version": "1.0"},
+            "error": {"code": 123},
+            "policy": {"max_message_length": 300, "include_raw_message": True},
+        },
+    )
+    assert status == 200
+    assert body["result"]["error"] == {
+        "class": "UNKNOWN",
+        "code": "123",
+        "message": "",
+        "retryable": False,
+        "severity": "medium",
+        "where": {"tool": "svc", "stage": "run", "path": ""},
+        "http_status": 0,
+        "fingerprint": "e613297559836f3c",
+    }
+
+    status, body = request_json(
+        app,
+        "POST",
+        "/tools/structured_error",
+        {
+            "source": {"tool": "svc", "stage": "run", "version": "1.0"},
+            "error": {"status": "503"},
+            "policy": {"max_message_length": 300, "include_raw_message": True},
+        },
+    )
+    assert status == 200
+    assert body["result"]["error"]["class"] == "UPSTREAM"
+    assert body["result"]["error"]["http_status"] == 503
+
+
+def test_structured_error_classifies_from_message_head_only():
+    status, body = request_json(
+        app,
+        "POST",
+        "/tools/structured_error",
+        {
+            "source": {"tool": "svc", "stage": "run", "version": "1.0"},
+            "error": {"message": ("x" * 600) + " not found"},
+            "policy": {"max_message_length": 10, "include_raw_message": True},
+        },
+    )
+    assert status == 200
+    assert body["result"]["error"]["class"] == "UNKNOWN"
+    assert body["result"]["error"]["message"] == "xxxxxxxxxx..."
+
+
+def test_structured_error_rejects_bool_max_message_length():
+    status, body = request_json(
+        app,
+        "POST",
+        "/tools/structured_error",
+        {
+            "source": {"tool": "svc", "stage": "run", "version": "1.0"},
+            "error": "boom",
+            "policy": {"max_message_length": True, "include_raw_message": True},
+        },
+    )
+    assert status == 400
+    assert body["error"]["code"] == "INPUT_INVALID"
+
+
+def test_structured_error_rejects_extra_source_and_policy_keys():
+    for source, policy in (
+        ({"tool": "svc", "stage": "run", "extra": 1}, {}),
+        ({"tool": "svc", "stage": "run"}, {"extra": 1}),
+    ):
+        status, body = request_json(
+            app,
+            "POST",
+            "/tools/structured_error",
+            {"source": source, "error": "boom", "policy": policy},
+        )
+        assert status == 400
+        assert body["error"]["code"] == "INPUT_INVALID"
+
+
+def test_structured_error_accepts_null_version():
+    status, body = request_json(
+        app,
+        "POST",
+        "/tools/structured_error",
+        {
+            "source": {"tool": "svc", "stage": "run", "version": None},
+            "error": "boom",
+            "policy": {},
+        },
+    )
+    assert status == 200
+    assert body["ok"] is True
+
+
+def test_structured_error_oversized_http_status():
+    status, body = request_json(
+        app,
+        "POST",
+        "/tools/structured_error",
+        {
+            "source": {"tool": "svc", "stage": "run", "version": "1.0"},
+            "error": {"http_status": 10**20},
+            "policy": {"max_message_length": 300, "include_raw_message": True},
+        },
+    )
+    assert status == 200
+    assert body["result"]["error"]["http_status"] == 10**20
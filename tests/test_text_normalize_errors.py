@@ -16,3 +16,15 @@ def test_invalid_ops_type():
     status, body = request_json(app, "POST", "/tools/text_normalize", {"text": "ok", "ops": {"trim": "yes"}})
     assert status == 400
     assert body["error"]["code"] == "INPUT_INVALID"
+
+
+def test_unknown_ops_key():
+    status, body = request_json(app, "POST", "/tools/text_normalize", {"text": "ok", "ops": {"shout": True}})
+    assert status == 400
+    assert body["error"]["code"] == "INPUT_INVALID"
+
+
+def test_null_ops():
+    status, body = request_json(app, "POST", "/tools/text_normalize", {"text": "ok", "ops": None})
+    assert status == 400
+    assert body["error"]["code"] == "INPUT_INVALID"
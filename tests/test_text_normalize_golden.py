@@ -116,3 +116,15 @@ def test_invalid_text_type():
             "fingerprint": "6949dfdd6bbc64d3",
         },
     }
+
+
+def test_collapse_whitespace_keeps_newlines():
+    status, body = request_json(
+        app,
+        "POST",
+        "/tools/text_normalize",
+        {"text": "a  b\n\tc \t d\n", "ops": {"collapse_whitespace": True}, "options": {"preserve_tabs": False}},
+    )
+    assert status == 200
+    assert body["result"]["text"] == "a b\n c d\n"
+    assert body["result"]["meta"]["applied"] == ["collapse_whitespace"]
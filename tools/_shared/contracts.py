@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import orjson
+
 from tools.capability_contract import CONTRACT as CAPABILITY_CONTRACT_CONTRACT
 from tools.enum_registry import CONTRACT as ENUM_REGISTRY_CONTRACT
 from tools.input_gate import CONTRACT as INPUT_GATE_CONTRACT
@@ -27,6 +29,9 @@ CONTRACTS = {
     ]
 }
 
+# Contracts never change after import, so each is serialized once and served as raw bytes.
+CONTRACT_BYTES = {name: orjson.dumps(contract) for name, contract in CONTRACTS.items()}
+
 
 def contract_summaries() -> list[dict[str, str]]:
     summaries = []
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content)
+        except TypeError:
+            # orjson rejects ints wider than 64 bits; the stdlib encoder does not.
+            return super().render(content)
@@ -1,13 +1,34 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Any
+from typing import Annotated, Any
 
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, StrictBool, StrictInt, StrictStr, ValidationError
+from pydantic import AliasChoices, BaseModel, BeforeValidator, Field, StrictBool, StrictInt, StrictStr, ValidationError, field_validator
 
-router = APIRouter()
+from tools._shared.responses import ORJSONResponse
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+TOOL_NAME = "structured_error"
+TOOL_VERSION = "1.0"
+
+# error class -> (severity, retryable)
+_CLASS_ATTRS: dict[str, tuple[str, bool]] = {
+    "INPUT_INVALID": ("low", False),
+    "RULES_INVALID": ("low", False),
+    "SCHEMA_UNSUPPORTED": ("low", False),
+    "RATE_LIMIT": ("medium", True),
+    "TIMEOUT": ("medium", True),
+    "UPSTREAM": ("medium", True),
+    "INTERNAL": ("high", False),
+}
+_DEFAULT_CLASS_ATTRS = ("medium", False)
+
+# Only the head of the message is scanned for markers, bounding classifier cost on huge inputs.
+_CLASSIFY_SCAN_LIMIT = 512
+
+_ERR_ENVELOPE = {"ok": False, "tool": TOOL_NAME, "version": TOOL_VERSION, "result": None}
 
 
 class Source(BaseModel):
@@ -19,16 +40,47 @@ class Source(BaseModel):
         extra = "forbid"
 
 
+def _coerce_int(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except TypeError as exc:
+        raise ValueError(str(exc)) from exc
+
+
+def _coerce_details(value: Any) -> dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+# Upstream error objects come in many shapes, so fields are coerced like str()/int() rather than strict.
+LaxStr = Annotated[str, BeforeValidator(str)]
+LaxInt = Annotated[int, BeforeValidator(_coerce_int)]
+
+
 class ErrorInput(BaseModel):
-    code: StrictStr | None = ""
-    message: StrictStr | None = ""
-    type: StrictStr | None = ""
-    http_status: StrictInt | None = 0
-    path: StrictStr | None = ""
-    details: dict[str, Any] = Field(default_factory=dict)
+    code: LaxStr = ""
+    message: LaxStr = ""
+    type: LaxStr = ""
+    http_status: LaxInt = 0
+    path: LaxStr = ""
+    details: Annotated[dict[str, Any], BeforeValidator(_coerce_details)] = Field(default_factory=dict)
+
+    @field_validator("code", mode="after")
+    @classmethod
+    def _strip_code(cls, value: str) -> str:
+        return value.strip()
 
     class Config:
-        extra = "forbid"
+        extra = "ignore"
+
+
+# Only a bare error object falls back to detail/status; a wrapped {"error": {...}} reads the canonical names.
+class FlatErrorInput(ErrorInput):
+    message: LaxStr = Field(default="", validation_alias=AliasChoices("message", "detail"))
+    http_status: LaxInt = Field(default=0, validation_alias=AliasChoices("http_status", "status"))
+
+    class Config:
+        extra = "ignore"
+        populate_by_name = True
 
 
 class Policy(BaseModel):
@@ -48,6 +100,40 @@ class Input(BaseModel):
         extra = "forbid"
 
 
+_INPUT_KEYS = frozenset(Input.model_fields)
+_SOURCE_KEYS = frozenset(Source.model_fields)
+_POLICY_KEYS = frozenset(Policy.model_fields)
+
+
+def _is_strict_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+# Input.model_validate rules, checked by hand; returns (tool, stage, error, max_message_length, include_raw_message).
+def _validate_payload(payload: Any) -> tuple[str, str, Any, int, bool]:
+    if not isinstance(payload, dict) or payload.keys() != _INPUT_KEYS:
+        raise ValueError("payload")
+
+    source = payload["source"]
+    if not isinstance(source, dict) or not _SOURCE_KEYS.issuperset(source):
+        raise ValueError("source")
+    tool = source.get("tool")
+    stage = source.get("stage")
+    version = source.get("version")
+    if not isinstance(tool, str) or not isinstance(stage, str) or not (version is None or isinstance(version, str)):
+        raise ValueError("source")
+
+    policy = payload["policy"]
+    if not isinstance(policy, dict) or not _POLICY_KEYS.issuperset(policy):
+        raise ValueError("policy")
+    max_message_length = policy.get("max_message_length", 300)
+    include_raw_message = policy.get("include_raw_message", True)
+    if not _is_strict_int(max_message_length) or not isinstance(include_raw_message, bool):
+        raise ValueError("policy")
+
+    return tool, stage, payload["error"], max_message_length, include_raw_message
+
+
 def _fingerprint(tool: str, stage: str, error_class: str, code: str, http_status: int) -> str:
     raw = f"{tool}|{stage}|{error_class}|{code}|{http_status}"
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
@@ -61,9 +147,9 @@ def _structured_error(code: str, message: str, http_status: int = 400, path: str
         "message": message,
         "retryable": False,
         "severity": "low",
-        "where": {"tool": "structured_error", "stage": "validate", "path": path},
+        "where": {"tool": TOOL_NAME, "stage": "validate", "path": path},
         "http_status": http_status,
-        "fingerprint": _fingerprint("structured_error", "validate", error_class, code, http_status),
+        "fingerprint": _STATIC_FINGERPRINTS.get((code, http_status)) or _fingerprint(TOOL_NAME, "validate", error_class, code, http_status),
     }
 
 
@@ -91,89 +177,71 @@ def _classify_error(code: str, http_status: int, message: str, error_type: str)
     return "UNKNOWN"
 
 
-def _retryable(error_class: str) -> bool:
-    return error_class in {"RATE_LIMIT", "TIMEOUT", "UPSTREAM"}
+def _class_attrs(error_class: str) -> tuple[str, bool]:
+    return _CLASS_ATTRS.get(error_class, _DEFAULT_CLASS_ATTRS)
 
 
-def _severity(error_class: str) -> str:
-    if error_class in {"INPUT_INVALID", "RULES_INVALID", "SCHEMA_UNSUPPORTED"}:
-        return "low"
-    if error_class in {"RATE_LIMIT", "TIMEOUT", "UPSTREAM"}:
-        return "medium"
-    if error_class == "INTERNAL":
-        return "high"
-    return "medium"
+def _fail(code: str, message: str, path: str = "") -> ORJSONResponse:
+    return ORJSONResponse(status_code=400, content={**_ERR_ENVELOPE, "error": _structured_error(code, message, path=path)})
 
 
 def _response(result: dict[str, Any]) -> dict[str, Any]:
-    return {"ok": True, "tool": "structured_error", "version": "1.0", "result": result, "error": None}
+    return {"ok": True, "tool": TOOL_NAME, "version": TOOL_VERSION, "result": result, "error": None}
+
+
+def _error_from_str(error_input: str) -> ErrorInput:
+    return ErrorInput(message=error_input)
+
+
+def _error_from_dict(error_input: dict[str, Any]) -> ErrorInput:
+    nested = error_input.get("error")
+    if type(nested) is dict:
+        return ErrorInput.model_validate(nested)
+    return FlatErrorInput.model_validate(error_input)
+
+
+# Bare message string, or an error object optionally wrapped as {"error": {...}}.
+_ERROR_EXTRACTORS = {str: _error_from_str, dict: _error_from_dict}
 
 
 def _extract_error(error_input: Any) -> ErrorInput:
-    if isinstance(error_input, str):
-        return ErrorInput(code="", message=error_input, type="", http_status=0, path="", details={})
-    if isinstance(error_input, dict):
-        if "error" in error_input and isinstance(error_input["error"], dict):
-            nested = error_input["error"]
-            return ErrorInput(
-                code=str(nested.get("code", "")),
-                message=str(nested.get("message", "")),
-                type=str(nested.get("type", "")),
-                http_status=int(nested.get("http_status", 0) or 0),
-                path=str(nested.get("path", "")),
-                details=nested.get("details", {}) if isinstance(nested.get("details"), dict) else {},
-            )
-        return ErrorInput(
-            code=str(error_input.get("code", "")),
-            message=str(error_input.get("message", error_input.get("detail", ""))),
-            type=str(error_input.get("type", "")),
-            http_status=int(error_input.get("http_status", error_input.get("status", 0)) or 0),
-            path=str(error_input.get("path", "")),
-            details=error_input.get("details", {}) if isinstance(error_input.get("details"), dict) else {},
-        )
-    raise TypeError("error must be an object or string.")
+    extract = _ERROR_EXTRACTORS.get(type(error_input))
+    if extract is None:
+        raise TypeError("error must be an object or string.")
+    return extract(error_input)
 
 
 @router.post("/tools/structured_error")
 def structured_error(payload: dict[str, Any]):
     try:
-        data = Input.model_validate(payload)
-    except ValidationError:
-        error = _structured_error("INPUT_INVALID", "Input must match the structured_error schema.")
-        return JSONResponse(status_code=400, content={"ok": False, "tool": "structured_error", "version": "1.0", "result": None, "error": error})
-
-    policy = data.policy
-    if not 1 <= policy.max_message_length <= 5000:
-        error = _structured_error("POLICY_INVALID", "policy.max_message_length must be an integer between 1 and 5000.", path="policy.max_message_length")
-        return JSONResponse(status_code=400, content={"ok": False, "tool": "structured_error", "version": "1.0", "result": None, "error": error})
-
-    source = data.source
-    if not source.tool.strip():
-        error = _structured_error("SOURCE_INVALID", "source.tool must be a non-empty string.", path="source.tool")
-        return JSONResponse(status_code=400, content={"ok": False, "tool": "structured_error", "version": "1.0", "result": None, "error": error})
-    if not source.stage.strip():
-        error = _structured_error("SOURCE_INVALID", "source.stage must be a non-empty string.", path="source.stage")
-        return JSONResponse(status_code=400, content={"ok": False, "tool": "structured_error", "version": "1.0", "result": None, "error": error})
+        tool, stage, error, max_message_length, include_raw_message = _validate_payload(payload)
+    except ValueError:
+        return _fail("INPUT_INVALID", "Input must match the structured_error schema.")
+
+    if not 1 <= max_message_length <= 5000:
+        return _fail("POLICY_INVALID", "policy.max_message_length must be an integer between 1 and 5000.", path="policy.max_message_length")
+
+    if not tool.strip():
+        return _fail("SOURCE_INVALID", "source.tool must be a non-empty string.", path="source.tool")
+    if not stage.strip():
+        return _fail("SOURCE_INVALID", "source.stage must be a non-empty string.", path="source.stage")
 
     try:
-        error_input = _extract_error(data.error)
-    except TypeError:
-        error = _structured_error("ERROR_INVALID", "error must be an object or string.", path="error")
-        return JSONResponse(status_code=400, content={"ok": False, "tool": "structured_error", "version": "1.0", "result": None, "error": error})
-
-    raw_message = error_input.message or ""
-    message = raw_message if policy.include_raw_message else ""
-    if len(message) > policy.max_message_length:
-        message = f"{message[:policy.max_message_length]}..."
-
-    http_status = error_input.http_status or 0
-    error_type = error_input.type or ""
-    code = error_input.code.strip() if error_input.code else ""
-    error_class = _classify_error(code, http_status, raw_message, error_type)
+        error_input = _extract_error(error)
+    except (TypeError, ValidationError):
+        return _fail("ERROR_INVALID", "error must be an object or string.", path="error")
+
+    raw_message = error_input.message
+    message = raw_message if include_raw_message else ""
+    if len(message) > max_message_length:
+        message = f"{message[:max_message_length]}..."
+
+    http_status = error_input.http_status
+    code = error_input.code
+    error_class = _classify_error(code, http_status, raw_message[:_CLASSIFY_SCAN_LIMIT], error_input.type)
     if not code:
         code = error_class
-    retryable = _retryable(error_class)
-    severity = _severity(error_class)
+    severity, retryable = _class_attrs(error_class)
 
     normalized = {
         "class": error_class,
@@ -181,9 +249,9 @@ def structured_error(payload: dict[str, Any]):
         "message": message,
         "retryable": retryable,
         "severity": severity,
-        "where": {"tool": source.tool, "stage": source.stage, "path": error_input.path or ""},
+        "where": {"tool": tool, "stage": stage, "path": error_input.path},
         "http_status": http_status,
-        "fingerprint": _fingerprint(source.tool, source.stage, error_class, code, http_status),
+        "fingerprint": _fingerprint(tool, stage, error_class, code, http_status),
     }
 
     return _response({"error": normalized})
@@ -318,3 +386,10 @@ CONTRACT = {
         }
     ],
 }
+
+
+# Validation errors only vary by code, so the fingerprints of the contract's codes are computed once.
+_STATIC_FINGERPRINTS = {
+    (entry["code"], 400): _fingerprint(TOOL_NAME, "validate", "INPUT_INVALID", entry["code"], 400)
+    for entry in CONTRACT["errors"]["codes"]
+}
@@ -83,15 +83,43 @@ Response JSON schema:
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import re
-from typing import Any
+from typing import Any, Callable
 
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, StrictBool, StrictStr, ValidationError
+from pydantic import BaseModel, Field, StrictBool, StrictStr
 
-router = APIRouter()
+from tools._shared.responses import ORJSONResponse
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+TOOL_NAME = "text_normalize"
+TOOL_VERSION = "1.0"
+
+_ERR_ENVELOPE = {"ok": False, "tool": TOOL_NAME, "version": TOOL_VERSION, "result": None}
+
+_CR_RE = re.compile(r"\r\n?")
+_SPACES_RE = re.compile(r"[ ]{2,}")
+_TAB_SPACES_RE = re.compile(r"[\t ]+")
+
+
+def _control_char_table(preserve_tabs: bool, preserve_newlines: bool) -> dict[int, None]:
+    allowed = set()
+    if preserve_tabs:
+        allowed.add(ord("\t"))
+    if preserve_newlines:
+        allowed.add(ord("\n"))
+    return dict.fromkeys(code for code in range(32) if code not in allowed)
+
+
+# (preserve_tabs, preserve_newlines) -> str.translate table deleting the other C0 control chars
+_CONTROL_CHAR_TABLES = {
+    (preserve_tabs, preserve_newlines): _control_char_table(preserve_tabs, preserve_newlines)
+    for preserve_tabs in (True, False)
+    for preserve_newlines in (True, False)
+}
 
 
 class Ops(BaseModel):
@@ -123,6 +151,33 @@ class Input(BaseModel):
         extra = "forbid"
 
 
+_INPUT_KEYS = frozenset(Input.model_fields)
+_OPS_KEYS = frozenset(Ops.model_fields)
+_OPTIONS_KEYS = frozenset(Options.model_fields)
+_NO_FLAGS: dict[str, bool] = {}
+
+
+def _bool_flags(value: Any, keys: frozenset[str]) -> dict[str, bool]:
+    if not isinstance(value, dict) or not keys.issuperset(value):
+        raise ValueError("flags")
+    for flag in value.values():
+        if not isinstance(flag, bool):
+            raise ValueError("flags")
+    return value
+
+
+# Returns (text, ops, options); the flag dicts hold only the keys the caller sent, so read them with
+# the Ops/Options defaults.
+def _validate_payload(payload: Any) -> tuple[str, dict[str, bool], dict[str, bool]]:
+    if not isinstance(payload, dict) or not _INPUT_KEYS.issuperset(payload):
+        raise ValueError("payload")
+    text = payload.get("text")
+    if not isinstance(text, str):
+        raise ValueError("text")
+    return text, _bool_flags(payload.get("ops", _NO_FLAGS), _OPS_KEYS), _bool_flags(payload.get("options", _NO_FLAGS), _OPTIONS_KEYS)
+
+
+@functools.lru_cache(maxsize=2048)
 def _fingerprint(tool: str, stage: str, error_class: str, code: str, http_status: int) -> str:
     raw = f"{tool}|{stage}|{error_class}|{code}|{http_status}"
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
@@ -136,93 +191,124 @@ def _structured_error(code: str, message: str, http_status: int = 400, path: str
         "message": message,
         "retryable": False,
         "severity": "low",
-        "where": {"tool": "text_normalize", "stage": "validate", "path": path},
+        "where": {"tool": TOOL_NAME, "stage": "validate", "path": path},
         "http_status": http_status,
-        "fingerprint": _fingerprint("text_normalize", "validate", error_class, code, http_status),
+        "fingerprint": _STATIC_FINGERPRINTS.get((code, http_status)) or _fingerprint(TOOL_NAME, "validate", error_class, code, http_status),
     }
 
 
-def _collapse_whitespace(text: str, preserve_tabs: bool, preserve_newlines: bool) -> str:
-    if preserve_newlines:
-        lines = text.split("\n")
-        collapsed_lines = []
-        for line in lines:
-            if preserve_tabs:
-                collapsed_lines.append(re.sub(r"[ ]+", " ", line))
-            else:
-                collapsed_lines.append(re.sub(r"[\t ]+", " ", line))
-        return "\n".join(collapsed_lines)
-    if preserve_tabs:
-        return re.sub(r"[ ]+", " ", text)
-    return re.sub(r"[\t ]+", " ", text)
+# Each op step returns the transformed text, or None when the op leaves the text unchanged.
+# Cheap scans skip the work entirely where they prove the op is a no-op.
+def _normalize_newlines(text: str) -> str | None:
+    if "\r" not in text:
+        return None
+    return _CR_RE.sub("\n", text)
+
+
+def _remove_control_chars(preserve_tabs: bool, preserve_newlines: bool) -> Callable[[str], str | None]:
+    table = _CONTROL_CHAR_TABLES[(preserve_tabs, preserve_newlines)]
+
+    def step(text: str) -> str | None:
+        normalized = text.translate(table)
+        # translate only deletes here, so an unchanged length means unchanged text.
+        return normalized if len(normalized) != len(text) else None
 
+    return step
 
-def _remove_control_chars(text: str, preserve_tabs: bool, preserve_newlines: bool) -> str:
-    allowed = {"\t", "\n"}
-    if not preserve_tabs:
-        allowed.discard("\t")
-    if not preserve_newlines:
-        allowed.discard("\n")
-    return "".join(ch for ch in text if ord(ch) >= 32 or ch in allowed)
+
+def _collapse_whitespace(preserve_tabs: bool) -> Callable[[str], str | None]:
+    # Neither pattern matches "\n", so line breaks survive without splitting into lines.
+    if preserve_tabs:
+        return lambda text: _SPACES_RE.sub(" ", text) if "  " in text else None
+    return lambda text: _TAB_SPACES_RE.sub(" ", text) if "  " in text or "\t" in text else None
+
+
+def _trim(text: str) -> str | None:
+    if text and (text[0].isspace() or text[-1].isspace()):
+        return text.strip()
+    return None
+
+
+def _to_lower(text: str) -> str | None:
+    if text.islower():
+        return None
+    normalized = text.lower()
+    return normalized if normalized != text else None
+
+
+def _to_upper(text: str) -> str | None:
+    if text.isupper():
+        return None
+    normalized = text.upper()
+    return normalized if normalized != text else None
+
+
+@functools.lru_cache(maxsize=None)
+def _pipeline(
+    normalize_newlines: bool,
+    remove_control_chars: bool,
+    collapse_whitespace: bool,
+    trim: bool,
+    to_lower: bool,
+    to_upper: bool,
+    preserve_tabs: bool,
+    preserve_newlines: bool,
+) -> tuple[tuple[str, Callable[[str], str | None]], ...]:
+    # Built once per ops/options combination (at most 256), holding only the enabled steps in order.
+    steps: list[tuple[str, Callable[[str], str | None]]] = []
+    if normalize_newlines:
+        steps.append(("normalize_newlines", _normalize_newlines))
+    if remove_control_chars:
+        steps.append(("remove_control_chars", _remove_control_chars(preserve_tabs, preserve_newlines)))
+    if collapse_whitespace:
+        steps.append(("collapse_whitespace", _collapse_whitespace(preserve_tabs)))
+    if trim:
+        steps.append(("trim", _trim))
+    if to_lower:
+        steps.append(("to_lower", _to_lower))
+    if to_upper:
+        steps.append(("to_upper", _to_upper))
+    return tuple(steps)
+
+
+def _err_response(error: dict[str, Any]) -> ORJSONResponse:
+    return ORJSONResponse(status_code=400, content={**_ERR_ENVELOPE, "error": error})
 
 
 @router.post("/tools/text_normalize")
 def text_normalize(payload: dict[str, Any]):
     try:
-        data = Input.model_validate(payload)
-    except ValidationError:
-        error = _structured_error("INPUT_INVALID", "Input must match the text_normalize schema.")
-        return JSONResponse(status_code=400, content={"ok": False, "tool": "text_normalize", "version": "1.0", "result": None, "error": error})
-
-    text = data.text
-    ops = data.ops
-    options = data.options
+        text, ops, options = _validate_payload(payload)
+    except ValueError:
+        return _INPUT_INVALID_RESPONSE
+
+    original_length = len(text)
     applied: list[str] = []
 
-    if ops.normalize_newlines:
-        normalized = text.replace("\r\n", "\n").replace("\r", "\n")
-        if normalized != text:
-            applied.append("normalize_newlines")
-        text = normalized
-
-    if ops.remove_control_chars:
-        normalized = _remove_control_chars(text, options.preserve_tabs, options.preserve_newlines)
-        if normalized != text:
-            applied.append("remove_control_chars")
-        text = normalized
-
-    if ops.collapse_whitespace:
-        normalized = _collapse_whitespace(text, options.preserve_tabs, options.preserve_newlines)
-        if normalized != text:
-            applied.append("collapse_whitespace")
-        text = normalized
-
-    if ops.trim:
-        normalized = text.strip()
-        if normalized != text:
-            applied.append("trim")
-        text = normalized
-
-    if ops.to_lower:
-        normalized = text.lower()
-        if normalized != text:
-            applied.append("to_lower")
-        text = normalized
-
-    if ops.to_upper:
-        normalized = text.upper()
-        if normalized != text:
-            applied.append("to_upper")
-        text = normalized
+    pipeline = _pipeline(
+        ops.get("normalize_newlines", False),
+        ops.get("remove_control_chars", False),
+        ops.get("collapse_whitespace", False),
+        ops.get("trim", False),
+        ops.get("to_lower", False),
+        ops.get("to_upper", False),
+        options.get("preserve_tabs", True),
+        options.get("preserve_newlines", True),
+    )
+    for name, step in pipeline:
+        normalized = step(text)
+        if normalized is not None:
+            applied.append(name)
+            text = normalized
 
     return {
         "ok": True,
-        "tool": "text_normalize",
-        "version": "1.0",
+        "tool": TOOL_NAME,
+        "version": TOOL_VERSION,
         "result": {
             "text": text,
             "meta": {
-                "original_length": len(data.text),
+                "original_length": original_length,
                 "normalized_length": len(text),
                 "applied": applied,
             },
@@ -354,3 +440,13 @@ CONTRACT = {
         }
     ],
 }
+
+
+# Validation errors only vary by code, so the fingerprints of the contract's codes are computed once.
+_STATIC_FINGERPRINTS = {
+    (entry["code"], 400): _fingerprint(TOOL_NAME, "validate", "INPUT_INVALID", entry["code"], 400)
+    for entry in CONTRACT["errors"]["codes"]
+}
+
+# The schema-mismatch response has fixed content, so it is built once and returned as-is.
+_INPUT_INVALID_RESPONSE = _err_response(_structured_error("INPUT_INVALID", "Input must match the text_normalize schema."))
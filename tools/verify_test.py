@@ -1,10 +1,13 @@
+from typing import Any
+
 from fastapi import APIRouter
-from pydantic import BaseModel, Field, StrictInt, StrictStr, ValidationError
+from pydantic import BaseModel, Field, StrictInt, StrictStr
 import hashlib
 
 from tools._shared.errors import make_error
+from tools._shared.responses import ORJSONResponse
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class Input(BaseModel):
@@ -15,22 +18,49 @@ class Input(BaseModel):
         extra = "forbid"
 
 
+_INPUT_KEYS = frozenset(Input.model_fields)
+
+
+# text must be a str and max_len a non-negative int (bools rejected), as in Input.
+def _validate_payload(payload: Any) -> tuple[str, int]:
+    if not isinstance(payload, dict) or not _INPUT_KEYS.issuperset(payload):
+        raise ValueError("payload")
+    text = payload.get("text", "")
+    max_len = payload.get("max_len", 2000)
+    if not isinstance(text, str):
+        raise ValueError("text")
+    if not isinstance(max_len, int) or isinstance(max_len, bool) or max_len < 0:
+        raise ValueError("max_len")
+    return text, max_len
+
+
+# Cloning an initialized hasher is cheaper than constructing a new one per request.
+_SHA256 = hashlib.sha256()
+
+# Failure responses have fixed content, so they are built once and returned as-is.
+_INPUT_INVALID = make_error("INPUT_INVALID", "Input must match the verify_test schema.")
+_INPUT_TOO_LONG = make_error("INPUT_TOO_LONG", "Input text exceeds max_len.")
+
+
 @router.post("/tools/verify_test")
 def verify_test(payload: dict):
     try:
-        data = Input.model_validate(payload)
-    except ValidationError:
-        return make_error("INPUT_INVALID", "Input must match the verify_test schema.")
+        text, max_len = _validate_payload(payload)
+    except ValueError:
+        return _INPUT_INVALID
 
-    if len(data.text) > data.max_len:
-        return make_error("INPUT_TOO_LONG", "Input text exceeds max_len.")
+    length = len(text)
+    if length > max_len:
+        return _INPUT_TOO_LONG
 
-    digest = hashlib.sha256(data.text.encode("utf-8")).hexdigest()
+    hasher = _SHA256.copy()
+    hasher.update(text.encode("utf-8"))
+    digest = hasher.hexdigest()
     return {
         "ok": True,
         "tool": "verify_test",
         "version": "1.0.0",
-        "result": {"text": data.text, "length": len(data.text), "sha256": digest},
+        "result": {"text": text, "length": length, "sha256": digest},
     }
 
 